@@ -0,0 +1,41 @@
+from __future__ import annotations
+import asyncio, time
+from typing import Any, Dict, List, Optional, Tuple
+from kernel.ports.index import WorldIndexProvider
+
+TreeKey = Tuple[str, Tuple[str, ...]]
+
+class CachingIndexProvider(WorldIndexProvider):
+    # Wraps any WorldIndexProvider; memoizes trees per (tenant_id, domains) for ttl_s seconds.
+    def __init__(self, inner: WorldIndexProvider, ttl_s: float = 300.0):
+        self.inner = inner
+        self.ttl_s = ttl_s
+        self._cache: Dict[TreeKey, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._locks: Dict[TreeKey, asyncio.Lock] = {}
+
+    async def load_or_build_trees(self, tenant_id: str, domains: List[str]) -> List[Dict[str, Any]]:
+        key = (tenant_id, tuple(sorted(domains)))
+        hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < self.ttl_s:
+            return hit[1]
+        # single-flight: concurrent misses for the same key share one build
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                hit = self._cache.get(key)
+                if hit and time.monotonic() - hit[0] < self.ttl_s:
+                    return hit[1]
+                trees = await self.inner.load_or_build_trees(tenant_id, domains)
+                self._cache[key] = (time.monotonic(), trees)
+                return trees
+        finally:
+            # drop the lock once the miss is resolved; waiters already hold a reference to it
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        if tenant_id is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[0] == tenant_id]:
+            del self._cache[key]
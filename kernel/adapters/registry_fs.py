@@ -1,12 +1,24 @@
 from __future__ import annotations
-import json, os
-from typing import Any, Dict
+import asyncio, json, os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from kernel.ports.registry import RegistryProvider
 from kernel.runtime.policy import apply_tenant_overrides
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install .[speedups])
+    orjson = None
+
+def _parse_registry(data: bytes) -> Dict[str, Any]:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 class FSRegistryProvider(RegistryProvider):
     def __init__(self, path: str):
         self.path = path
+        # parsed file keyed by mtime_ns; per-tenant merged views for that same mtime
+        self._file_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._tenant_cache: Dict[Tuple[int, str], Dict[str, Any]] = {}
 
     @classmethod
     def from_env(cls) -> "FSRegistryProvider":
@@ -14,6 +26,14 @@ class FSRegistryProvider(RegistryProvider):
         return cls(path)
 
     async def load_registry(self, tenant_id: str) -> Dict[str, Any]:
-        with open(self.path, "r", encoding="utf-8") as f:
-            reg = json.load(f)
-        return apply_tenant_overrides(reg, tenant_id)
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        if self._file_cache is None or self._file_cache[0] != mtime_ns:
+            # blocking read off the event loop; only on a cache miss
+            data = await asyncio.to_thread(Path(self.path).read_bytes)
+            self._file_cache = (mtime_ns, _parse_registry(data))
+            self._tenant_cache.clear()
+        key = (mtime_ns, tenant_id)
+        reg = self._tenant_cache.get(key)
+        if reg is None:
+            reg = self._tenant_cache[key] = apply_tenant_overrides(self._file_cache[1], tenant_id)
+        return reg
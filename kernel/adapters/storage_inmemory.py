@@ -1,20 +1,39 @@
 from __future__ import annotations
 import asyncio
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from kernel.ports.storage import Storage
 from kernel.ports.toolrunner import ToolRunner
 from kernel.runtime.errors import classify_error
 from kernel.runtime.retry import run_with_retry
 from kernel.runtime.idempotency import compute_idempotency_key
+from kernel.runtime.policy import index_actions
+
+# (arg key, (step_ref, field) for $sX.output.* references else None, literal value)
+CompiledArg = Tuple[str, Optional[Tuple[str, str]], Any]
+
+def _compile_args(args: Dict[str, Any]) -> List[CompiledArg]:
+    # parse $sX.output.* placeholders once per plan step instead of on every resolve
+    compiled: List[CompiledArg] = []
+    for k, v in args.items():
+        if isinstance(v, str) and v.startswith("$s"):
+            m = v.split(".")
+            compiled.append((k, (m[0][1:], m[-1]), None))  # ("s3", "ticket_id")
+        else:
+            compiled.append((k, None, v))
+    return compiled
 
 class InMemoryStorage(Storage):
-    def __init__(self):
+    def __init__(self, max_updates: int = 10_000):
         self.runs: Dict[str, Dict[str, Any]] = {}
-        self.updates: Dict[str, List[Dict[str, Any]]] = {}
+        self._run_id_to_task: Dict[str, str] = {}
+        # bounded ring buffers: keep the most recent max_updates events per run / persist calls overall
+        self.max_updates = max_updates
+        self.updates: Dict[str, Deque[Dict[str, Any]]] = {}
         self.step_cache: Dict[str, Dict[str, Any]] = {}
         self.approvals: Dict[str, Dict[str, Any]] = {}
-        self.persist_calls: List[Dict[str, Any]] = []
+        self.persist_calls: Deque[Dict[str, Any]] = deque(maxlen=max_updates)
         self.tenant_ctx = {
             "tenant_demo": {"tenant_id":"tenant_demo","roles":["support_agent"],"limits":{"max_tool_calls":50}},
             "tenant_enterprise_eu": {"tenant_id":"tenant_enterprise_eu","roles":["support_agent"],"limits":{"max_tool_calls":50}}
@@ -25,19 +44,30 @@ class InMemoryStorage(Storage):
         run_id = self.runs.get(task_id, {}).get("run_id") or f"run_{task_id}"
         run = self.runs.get(task_id) or {"run_id": run_id, "task_id": task_id, "tenant_id": tenant_id, "state":"submitted"}
         self.runs[task_id] = run
-        self.updates.setdefault(run_id, [])
+        self._run_id_to_task[run_id] = task_id
+        self._updates_for(run_id)
         return run
 
     async def set_run_state(self, run_id: str, state: str) -> None:
-        # find by run_id
-        for t, r in self.runs.items():
-            if r["run_id"] == run_id:
-                r["state"] = state
-                return
+        task_id = self._run_id_to_task.get(run_id)
+        if task_id is None:
+            return
+        self.runs[task_id]["state"] = state
+
+    def _updates_for(self, run_id: str) -> Deque[Dict[str, Any]]:
+        q = self.updates.get(run_id)
+        if q is None:
+            q = self.updates[run_id] = deque(maxlen=self.max_updates)
+        return q
 
     async def persist_update(self, run_id: str, update: Dict[str, Any]) -> None:
         self.persist_calls.append({"run_id": run_id, "update": update})
-        self.updates.setdefault(run_id, []).append(update)
+        self._updates_for(run_id).append(update)
+
+    async def persist_updates(self, run_id: str, updates: List[Dict[str, Any]]) -> None:
+        # one write for a batch of events (same ordering as repeated persist_update)
+        self.persist_calls.extend({"run_id": run_id, "update": u} for u in updates)
+        self._updates_for(run_id).extend(updates)
 
     async def load_tenant_context(self, tenant_id: str) -> Dict[str, Any]:
         return dict(self.tenant_ctx.get(tenant_id, {"tenant_id":tenant_id,"roles":["support_agent"],"limits":{"max_tool_calls":50}}))
@@ -64,37 +94,63 @@ class InMemoryStorage(Storage):
         tenant_id = task_input["tenant_id"]
         task_id = task_input["task_id"]
 
-        # helpers
+        # helpers (index the registry once per plan instead of scanning per step)
+        actions_by_id = index_actions(registry)
+        # retry_on normalized to frozenset once here; run_with_retry uses it as-is
+        retries_by_id = {rc.get("id"): {**rc, "retry_on": frozenset(rc.get("retry_on") or ())} for rc in registry.get("retry_classes", [])}
+        no_retry = {"max_attempts":1,"backoff_ms":[],"retry_on":frozenset()}
+
         def find_action(action_id: str) -> Dict[str, Any]:
-            for a in registry.get("actions", []):
-                if a.get("action_id") == action_id:
-                    return a
-            raise ValueError(f"Unknown action_id: {action_id}")
+            try:
+                return actions_by_id[action_id]
+            except KeyError:
+                raise ValueError(f"Unknown action_id: {action_id}") from None
 
         def find_retry(rc_id: str) -> Dict[str, Any]:
-            for rc in registry.get("retry_classes", []):
-                if rc.get("id") == rc_id:
-                    return rc
-            return {"max_attempts":1,"backoff_ms":[],"retry_on":[]}
+            return retries_by_id.get(rc_id, no_retry)
 
         # crude resolver for $sX.output.* references (starter)
         outputs: Dict[str, Dict[str, Any]] = {}
         results: List[Dict[str, Any]] = []
 
-        async def resolve_args(args: Dict[str, Any]) -> Dict[str, Any]:
-            # replace known patterns
-            resolved = {}
-            for k, v in args.items():
-                if isinstance(v, str) and v.startswith("$s"):
-                    m = v.split(".")
-                    step_ref = m[0][1:]  # s3
-                    field = m[-1]
-                    resolved[k] = outputs.get(step_ref, {}).get(field)
-                else:
-                    resolved[k] = v
-            return resolved
-
-        for step in plan.get("steps", []):
+        def resolve_args(compiled: List[CompiledArg]) -> Dict[str, Any]:
+            return {k: (outputs.get(ref[0], {}).get(ref[1]) if ref else v) for k, ref, v in compiled}
+
+        # dependency waves: explicit depends_on plus steps referenced via $sX.output.*
+        steps = plan.get("steps", [])
+        step_ids = {st["step_id"] for st in steps}
+        if len(step_ids) != len(steps):
+            counts: Dict[str, int] = {}
+            for st in steps:
+                counts[st["step_id"]] = counts.get(st["step_id"], 0) + 1
+            raise ValueError(f"Duplicate step_id in plan: {sorted(k for k, n in counts.items() if n > 1)}")
+        # step_id -> (raw args, compiled args or None when the step has no references)
+        compiled_args: Dict[str, Tuple[Dict[str, Any], Optional[List[CompiledArg]]]] = {}
+        deps: Dict[str, set] = {}
+        for st in steps:
+            raw_args = st.get("args") or {}
+            ca = _compile_args(raw_args)
+            refs = [ref[0] for _, ref, _ in ca if ref]
+            compiled_args[st["step_id"]] = (raw_args, ca if refs else None)
+            d = set(st.get("depends_on") or [])
+            d.update(refs)
+            deps[st["step_id"]] = (d & step_ids) - {st["step_id"]}
+
+        waves: List[List[Dict[str, Any]]] = []
+        done: set = set()
+        remaining = list(steps)
+        while remaining:
+            wave = [st for st in remaining if deps[st["step_id"]] <= done]
+            if not wave:
+                raise ValueError(f"Cyclic depends_on in plan: {sorted(st['step_id'] for st in remaining)}")
+            waves.append(wave)
+            done.update(st["step_id"] for st in wave)
+            remaining = [st for st in remaining if st["step_id"] not in done]
+
+        key_locks: Dict[str, asyncio.Lock] = {}
+
+        async def execute_step(step: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+            # returns (step_result, stop)
             step_id = step["step_id"]
             action_id = step["action_id"]
             a = find_action(action_id)
@@ -102,44 +158,68 @@ class InMemoryStorage(Storage):
             timeout_ms = int(a.get("timeout_ms", 15000))
             retry_cfg = find_retry(a.get("retry_class","none"))
 
-            raw_args = step.get("args") or {}
-            args = await resolve_args(raw_args)
+            raw_args, ca = compiled_args[step_id]
+            args = raw_args if ca is None else resolve_args(ca)
 
             idem_mode = (a.get("idempotency") or {}).get("mode", "hash_args")
             if idem_mode == "explicit_key":
                 idem_key = args.get("idempotency_key")
                 if not idem_key:
                     # hard fail in starter
-                    result = {"step_id":step_id,"status":"failed","attempts":1,"tool":tool,"action_id":action_id,"error":{"class":"VALIDATION","message":"missing idempotency_key"}}
-                    results.append(result)
-                    return results
+                    return {"step_id":step_id,"status":"failed","attempts":1,"tool":tool,"action_id":action_id,"error":{"class":"VALIDATION","message":"missing idempotency_key"}}, True
             else:
                 idem_key = compute_idempotency_key(tenant_id=tenant_id, run_id=run_id, step_id=step_id, action_id=action_id, args=args)
 
-            cached = await self.get_step_result(idem_key)
-            if cached:
-                results.append({**cached, "cache_hit": True})
-                outputs[step_id] = cached.get("output") or {}
-                continue
-
-            async def tool_call():
-                # timeout wrapper
-                return await asyncio.wait_for(tools.call(tenant_id, tool, args), timeout=timeout_ms/1000)
-
-            out, err, attempts = await run_with_retry(call=tool_call, classify_error=classify_error, retry_cfg=retry_cfg)
-            if err:
-                sr = {"step_id":step_id,"status":"failed","attempts":attempts,"tool":tool,"action_id":action_id,"idempotency_key": idem_key,"error":err}
+            # single-flight per key: steps of one wave sharing a key must not both miss the cache
+            async with key_locks.setdefault(idem_key, asyncio.Lock()):
+                cached = await self.get_step_result(idem_key)
+                if cached:
+                    outputs[step_id] = cached.get("output") or {}
+                    return {**cached, "cache_hit": True}, False
+
+                async def tool_call():
+                    # timeout scoped to the current task (no extra Task/Future like wait_for)
+                    async with asyncio.timeout(timeout_ms/1000):
+                        return await tools.call(tenant_id, tool, args)
+
+                out, err, attempts = await run_with_retry(call=tool_call, classify_error=classify_error, retry_cfg=retry_cfg)
+                if err:
+                    sr = {"step_id":step_id,"status":"failed","attempts":attempts,"tool":tool,"action_id":action_id,"idempotency_key": idem_key,"error":err}
+                    await self.save_step_result(idem_key, sr)
+                    return sr, True
+
+                sr = {"step_id":step_id,"status":"succeeded","attempts":attempts,"tool":tool,"action_id":action_id,"idempotency_key": idem_key,"output":out}
                 await self.save_step_result(idem_key, sr)
-                results.append(sr)
-                return results
-
-            sr = {"step_id":step_id,"status":"succeeded","attempts":attempts,"tool":tool,"action_id":action_id,"idempotency_key": idem_key,"output":out}
-            await self.save_step_result(idem_key, sr)
-            results.append(sr)
-            outputs[step_id] = out
+                outputs[step_id] = out
 
             # optional crash simulation for replay test
             if task_input.get("metadata", {}).get("crash_after_step") == step_id:
                 raise RuntimeError("simulated crash")
+            return sr, False
+
+        # independent steps of a wave run concurrently; results come back in topological (wave) order,
+        # plan order within a wave. The first failed step cancels its still-running siblings.
+        for wave in waves:
+            tasks = [asyncio.ensure_future(execute_step(st)) for st in wave]
+            pending = set(tasks)
+            stop = False
+            try:
+                while pending and not stop:
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    stop = any(t.result()[1] for t in finished)
+            except BaseException:
+                for t in tasks:
+                    t.cancel()
+                # let siblings settle (and retrieve their exceptions) before the crash propagates
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            if pending:
+                for t in pending:
+                    t.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            # steps that finished before cancellation still happened: report them
+            results.extend(t.result()[0] for t in tasks if not t.cancelled() and t.exception() is None)
+            if stop:
+                return results
 
         return results
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Dict, List
 
@@ -28,18 +29,22 @@ class Kernel:
         run = await self.storage.create_or_load_run(task_id=task_input["task_id"], tenant_id=task_input["tenant_id"])
         run_id = run["run_id"]
 
-        ev = status_event(task_input["task_id"], run_id, "submitted", "Task accepted")
-        await self.storage.persist_update(run_id, ev)
-        yield ev
-
+        # submitted -> working: one state write and one batched persist for both events
         await self.storage.set_run_state(run_id, "working")
-        ev = status_event(task_input["task_id"], run_id, "working", "Running")
-        await self.storage.persist_update(run_id, ev)
-        yield ev
+        pending = [
+            status_event(task_input["task_id"], run_id, "submitted", "Task accepted"),
+            status_event(task_input["task_id"], run_id, "working", "Running"),
+        ]
+        await self.storage.persist_updates(run_id, pending)
+        for ev in pending:
+            yield ev
 
-        tenant_ctx = await self.storage.load_tenant_context(task_input["tenant_id"])
-        reg = await self.registry.load_registry(task_input["tenant_id"])
-        trees = await self.index.load_or_build_trees(task_input["tenant_id"], ["support", "customers"])
+        # independent loads: run concurrently, barrier before node selection
+        tenant_ctx, reg, trees = await asyncio.gather(
+            self.storage.load_tenant_context(task_input["tenant_id"]),
+            self.registry.load_registry(task_input["tenant_id"]),
+            self.index.load_or_build_trees(task_input["tenant_id"], ["support", "customers"]),
+        )
         node_list = await self.planner.select_nodes(task_input["user_message"], trees, reg.get("policies", []))
         pack = await self.hydrator.hydrate(task_input["tenant_id"], task_input["user_message"], node_list, reg)
         plan = await self.planner.build_plan(pack)
@@ -82,12 +87,10 @@ class Kernel:
             yield ev
             return
 
-        for r in step_results:
-            ev = artifact_event(task_input["task_id"], run_id, "step_result", r)
-            await self.storage.persist_update(run_id, ev)
-            yield ev
-
+        # step results + terminal status go out as one batch: persisted together, then yielded
+        pending = [artifact_event(task_input["task_id"], run_id, "step_result", r) for r in step_results]
         final_state = "failed" if any(r.get("status") == "failed" for r in step_results) else "completed"
-        ev = status_event(task_input["task_id"], run_id, final_state, "Done")
-        await self.storage.persist_update(run_id, ev)
-        yield ev
+        pending.append(status_event(task_input["task_id"], run_id, final_state, "Done"))
+        await self.storage.persist_updates(run_id, pending)
+        for ev in pending:
+            yield ev
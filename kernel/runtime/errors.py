@@ -15,6 +15,9 @@ ERROR_UNKNOWN = "UNKNOWN"
 NON_RETRYABLE: Set[str] = {ERROR_AUTH, ERROR_PERMISSION, ERROR_VALIDATION}
 
 def classify_error(exc: Exception) -> str:
+    # asyncio.timeout / asyncio.wait_for raise TimeoutError with an empty message: classify by type
+    if isinstance(exc, TimeoutError):
+        return ERROR_TIMEOUT
     name = exc.__class__.__name__.lower()
     msg = str(exc).lower()
     if "unauthorized" in msg or "auth" in name:
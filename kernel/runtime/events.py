@@ -4,8 +4,17 @@ from typing import Any, Dict, Optional
 
 RUN_STATES = {"submitted","working","input-required","completed","failed","canceled"}
 
+# second-resolution timestamp cache (single event loop thread; worst case is a redundant format)
+_last_ts_sec = -1
+_last_ts_str = ""
+
 def now_iso() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    global _last_ts_sec, _last_ts_str
+    t = int(time.time())
+    if t != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+        _last_ts_sec = t
+    return _last_ts_str
 
 def status_event(task_id: str, run_id: str, state: str, message: str, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     assert state in RUN_STATES
@@ -3,9 +3,12 @@ import hashlib, json
 from typing import Any, Dict
 
 def _stable_json(obj: Any) -> str:
+    # key material stays on the stdlib encoder: orjson maps NaN/inf to null (collides with None)
+    # and accepts datetime/UUID/Enum that json rejects, so keys would depend on the extra
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 def compute_idempotency_key(*, tenant_id: str, run_id: str, step_id: str, action_id: str, args: Dict[str, Any]) -> str:
-    payload = {"tenant_id": tenant_id, "run_id": run_id, "step_id": step_id, "action_id": action_id, "args": args}
-    h = hashlib.sha256(_stable_json(payload).encode("utf-8")).hexdigest()
-    return "idem_" + h[:32]
+    # ids are hashed as a NUL-separated prefix; only args goes through the JSON encoder
+    h = hashlib.blake2b(f"{tenant_id}\x00{run_id}\x00{step_id}\x00{action_id}\x00".encode("utf-8"), digest_size=16)
+    h.update(_stable_json(args).encode("utf-8"))
+    return "idem_" + h.hexdigest()
@@ -1,11 +1,18 @@
 from __future__ import annotations
 from typing import Any, Dict, Tuple, List
 
-def _find_action(registry: Dict[str, Any], action_id: str) -> Dict[str, Any]:
-    for a in registry.get("actions", []):
-        if a.get("action_id") == action_id:
-            return a
-    raise ValueError(f"Unknown action_id: {action_id}")
+def index_actions(registry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    # reuse the index attached by apply_tenant_overrides when present
+    idx = registry.get("_actions_by_id")
+    if idx is None:
+        idx = {a.get("action_id"): a for a in registry.get("actions", [])}
+    return idx
+
+def _find_action(actions_by_id: Dict[str, Dict[str, Any]], action_id: str) -> Dict[str, Any]:
+    try:
+        return actions_by_id[action_id]
+    except KeyError:
+        raise ValueError(f"Unknown action_id: {action_id}") from None
 
 def apply_tenant_overrides(registry: Dict[str, Any], tenant_id: str) -> Dict[str, Any]:
     # Shallow clone; enough for starter
@@ -20,20 +27,27 @@ def apply_tenant_overrides(registry: Dict[str, Any], tenant_id: str) -> Dict[str
         reg["actions"] = [a for a in registry.get("actions", []) if a.get("action_id") in enabled_actions]
 
     # apply security overrides (simple JSON pointer-like patches)
-    for so in overrides.get("security_overrides", []):
-        aid = so["action_id"]
-        patches = so.get("set", [])
-        for a in reg["actions"]:
-            if a.get("action_id") != aid:
+    # copy-on-write: patched actions are replaced, never mutated, so the base registry stays shareable
+    security_overrides = overrides.get("security_overrides", [])
+    if security_overrides:
+        reg["actions"] = list(reg.get("actions", []))
+        pos = {a.get("action_id"): i for i, a in enumerate(reg["actions"])}
+        for so in security_overrides:
+            i = pos.get(so["action_id"])
+            if i is None:
                 continue
-            for p in patches:
+            a = reg["actions"][i] = {**reg["actions"][i], "security": dict(reg["actions"][i].get("security") or {})}
+            for p in so.get("set", []):
                 path = p["path"]
                 val = p["value"]
                 # Only implement /security/requires_approval and /security/allowed_roles in starter
                 if path == "/security/requires_approval":
-                    a.setdefault("security", {})["requires_approval"] = bool(val)
+                    a["security"]["requires_approval"] = bool(val)
                 if path == "/security/allowed_roles":
-                    a.setdefault("security", {})["allowed_roles"] = list(val)
+                    a["security"]["allowed_roles"] = list(val)
+
+    # action_id -> action for this tenant's view; reused by policy_gate_plan / execute_plan
+    reg["_actions_by_id"] = {a.get("action_id"): a for a in reg.get("actions", [])}
     return reg
 
 def policy_gate_plan(ctx: Dict[str, Any], plan: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
@@ -43,20 +57,22 @@ def policy_gate_plan(ctx: Dict[str, Any], plan: Dict[str, Any]) -> Tuple[bool, D
     needs_approval = bool(plan.get("controls", {}).get("requires_approval", False))
     violations: List[str] = []
 
-    roles = set(tenant.get("roles", []))
-    allowed_tools = set(tenant.get("allowed_tools", [])) if tenant.get("allowed_tools") else None
-    allowed_actions = set(tenant.get("allowed_actions", [])) if tenant.get("allowed_actions") else None
+    roles = frozenset(tenant.get("roles", []))
+    allowed_tools = frozenset(tenant.get("allowed_tools", [])) if tenant.get("allowed_tools") else None
+    allowed_actions = frozenset(tenant.get("allowed_actions", [])) if tenant.get("allowed_actions") else None
+    actions_by_id = index_actions(registry)
 
     for step in plan.get("steps", []):
         aid = step["action_id"]
         if allowed_actions is not None and aid not in allowed_actions:
             violations.append(f"Action not allowed: {aid}")
             continue
-        a = _find_action(registry, aid)
+        a = _find_action(actions_by_id, aid)
         tool = a.get("tool")
         if allowed_tools is not None and tool not in allowed_tools:
             violations.append(f"Tool not allowed: {tool}")
-        ar = set(a.get("security", {}).get("allowed_roles", []) or [])
+        # isdisjoint takes the list as-is: no per-step set allocation
+        ar = a.get("security", {}).get("allowed_roles")
         if ar and roles.isdisjoint(ar):
             violations.append(f"Role mismatch for action {aid}")
         if a.get("security", {}).get("requires_approval", False):
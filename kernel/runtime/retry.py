@@ -11,8 +11,11 @@ async def run_with_retry(
     retry_cfg: Dict[str, Any],
 ) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None, int]:
     max_attempts = int(retry_cfg.get("max_attempts", 1))
-    backoff_ms = list(retry_cfg.get("backoff_ms", []))
-    retry_on = set(retry_cfg.get("retry_on", []))
+    backoff_ms = retry_cfg.get("backoff_ms") or ()
+    retry_on = retry_cfg.get("retry_on") or ()
+    if not isinstance(retry_on, frozenset):
+        retry_on = frozenset(retry_on)
+    last_backoff = len(backoff_ms) - 1
     attempts = 0
     last_error = None
 
@@ -29,10 +32,10 @@ async def run_with_retry(
             if err_class not in retry_on or attempts >= max_attempts:
                 return None, last_error, attempts
 
-            delay = 0.25
             if backoff_ms:
-                idx = min(attempts - 1, len(backoff_ms) - 1)
-                delay = backoff_ms[idx] / 1000.0
+                delay = backoff_ms[min(attempts - 1, last_backoff)] / 1000.0
+            else:
+                delay = 0.25
             await asyncio.sleep(delay)
 
     return None, last_error, attempts
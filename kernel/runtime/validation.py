@@ -1,6 +1,8 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 import json
 
 from pathlib import Path
@@ -11,6 +13,16 @@ def validate_task_input(task_input: Dict[str, Any]) -> None:
     if missing:
         raise ValueError(f"Missing keys: {sorted(missing)}")
 
-def validate_plan(plan: Dict[str, Any], schema_path: str) -> None:
+@lru_cache(maxsize=32)
+def _load_validator(schema_path: str) -> Any:
+    # read + check + compile the schema once per path
     schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
-    validate(instance=plan, schema=schema)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def validate_plan(plan: Dict[str, Any], schema_path: str) -> None:
+    # same semantics as jsonschema.validate, without re-reading the schema per call
+    error = best_match(_load_validator(schema_path).iter_errors(plan))
+    if error is not None:
+        raise error
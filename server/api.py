@@ -6,17 +6,23 @@ from kernel.flow import Kernel
 from kernel.adapters.storage_inmemory import InMemoryStorage
 from kernel.adapters.registry_fs import FSRegistryProvider
 from kernel.adapters.index_inmemory import InMemoryIndexProvider
+from kernel.adapters.index_cache import CachingIndexProvider
 from kernel.adapters.planner_llm_stub import StubPlanner
 from kernel.adapters.hydrator_stub import StubHydrator
 from kernel.adapters.toolrunner_stub import StubToolRunner
 
 router = APIRouter()
 
+# shared across requests so the registry/tree caches survive between tasks
+# (FSRegistryProvider caches by file mtime itself; no TTL wrapper so edits apply on next load)
+_registry = FSRegistryProvider("./registry/registry_support_v1.json")
+_index = CachingIndexProvider(InMemoryIndexProvider())
+
 def get_kernel() -> Kernel:
     return Kernel(
         storage=InMemoryStorage(),
-        registry=FSRegistryProvider("./registry/registry_support_v1.json"),
-        index=InMemoryIndexProvider(),
+        registry=_registry,
+        index=_index,
         planner=StubPlanner(),
         hydrator=StubHydrator(),
         tools=StubToolRunner(),
@@ -3,6 +3,7 @@ from kernel.flow import Kernel
 from kernel.adapters.storage_inmemory import InMemoryStorage
 from kernel.adapters.registry_fs import FSRegistryProvider
 from kernel.adapters.index_inmemory import InMemoryIndexProvider
+from kernel.adapters.index_cache import CachingIndexProvider
 from kernel.adapters.planner_llm_stub import StubPlanner
 from kernel.adapters.hydrator_stub import StubHydrator
 from kernel.adapters.toolrunner_stub import StubToolRunner
@@ -24,7 +25,7 @@ def kernel(storage, tools, registry_provider):
     return Kernel(
         storage=storage,
         registry=registry_provider,
-        index=InMemoryIndexProvider(),
+        index=CachingIndexProvider(InMemoryIndexProvider()),
         planner=StubPlanner(),
         hydrator=StubHydrator(),
         tools=tools,
@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+
+class SlowTools:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def call(self, tenant_id, tool, args):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"value": args["n"]}
+
+REGISTRY = {"actions":[{"action_id":"act_slow","tool":"slow"}],"retry_classes":[]}
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(storage):
+    tools = SlowTools()
+    plan = {"steps":[
+        {"step_id":"s1","action_id":"act_slow","args":{"n":1}},
+        {"step_id":"s2","action_id":"act_slow","args":{"n":2}},
+        {"step_id":"s3","action_id":"act_slow","args":{"n":"$s1.output.value"}},
+    ]}
+    task_input = {"task_id":"t","tenant_id":"tenant_demo"}
+    results = await storage.execute_plan("run_t", task_input, plan, REGISTRY, tools)
+
+    assert [r["step_id"] for r in results] == ["s1","s2","s3"]
+    assert tools.max_in_flight == 2
+    # s3 waits for s1 through its $s1 reference even without depends_on
+    assert results[2]["output"] == {"value": 1}
+
+@pytest.mark.asyncio
+async def test_cyclic_depends_on_rejected(storage):
+    plan = {"steps":[
+        {"step_id":"s1","action_id":"act_slow","args":{"n":1},"depends_on":["s2"]},
+        {"step_id":"s2","action_id":"act_slow","args":{"n":2},"depends_on":["s1"]},
+    ]}
+    with pytest.raises(ValueError):
+        await storage.execute_plan("run_t", {"task_id":"t","tenant_id":"tenant_demo"}, plan, REGISTRY, SlowTools())
+
+class FailFirstTools(SlowTools):
+    def __init__(self):
+        super().__init__()
+        self.completed = []
+
+    async def call(self, tenant_id, tool, args):
+        if args["n"] == "fail":
+            raise RuntimeError("unauthorized")
+        await asyncio.sleep(1)
+        self.completed.append(args["n"])
+        return {"value": args["n"]}
+
+@pytest.mark.asyncio
+async def test_failed_step_cancels_running_siblings(storage):
+    tools = FailFirstTools()
+    plan = {"steps":[
+        {"step_id":"s1","action_id":"act_slow","args":{"n":"fail"}},
+        {"step_id":"s2","action_id":"act_slow","args":{"n":2}},
+    ]}
+    results = await asyncio.wait_for(storage.execute_plan("run_t", {"task_id":"t","tenant_id":"tenant_demo"}, plan, REGISTRY, tools), timeout=0.5)
+
+    assert [(r["step_id"], r["status"]) for r in results] == [("s1","failed")]
+    assert tools.completed == []
+
+@pytest.mark.asyncio
+async def test_same_key_steps_in_one_wave_call_tool_once(storage):
+    tools = SlowTools()
+    registry = {"actions":[{"action_id":"act_send","tool":"slow","idempotency":{"mode":"explicit_key"}}],"retry_classes":[]}
+    plan = {"steps":[
+        {"step_id":"s1","action_id":"act_send","args":{"n":1,"idempotency_key":"k"}},
+        {"step_id":"s2","action_id":"act_send","args":{"n":1,"idempotency_key":"k"}},
+    ]}
+    results = await storage.execute_plan("run_t", {"task_id":"t","tenant_id":"tenant_demo"}, plan, registry, tools)
+
+    assert tools.calls == 1
+    assert [r.get("cache_hit", False) for r in results] == [False, True]
+
+@pytest.mark.asyncio
+async def test_duplicate_step_id_rejected(storage):
+    plan = {"steps":[
+        {"step_id":"s1","action_id":"act_slow","args":{"n":1}},
+        {"step_id":"s1","action_id":"act_slow","args":{"n":2}},
+    ]}
+    with pytest.raises(ValueError):
+        await storage.execute_plan("run_t", {"task_id":"t","tenant_id":"tenant_demo"}, plan, REGISTRY, SlowTools())
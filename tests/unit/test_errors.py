@@ -0,0 +1,14 @@
+import asyncio
+from kernel.runtime.errors import classify_error, ERROR_AUTH, ERROR_RATE_LIMIT, ERROR_TIMEOUT, ERROR_TRANSIENT, ERROR_UNKNOWN
+
+class AuthError(Exception): ...
+
+def test_classify_by_message():
+    assert classify_error(Exception("429 rate limit")) == ERROR_RATE_LIMIT
+    assert classify_error(Exception("Unauthorized")) == ERROR_AUTH
+    assert classify_error(Exception("boom")) == ERROR_UNKNOWN
+
+def test_classify_by_type():
+    assert classify_error(AuthError("429")) == ERROR_AUTH
+    assert classify_error(ConnectionResetError()) == ERROR_TRANSIENT
+    assert classify_error(asyncio.TimeoutError()) == ERROR_TIMEOUT
@@ -1,3 +1,5 @@
+import datetime
+import pytest
 from kernel.runtime.idempotency import compute_idempotency_key
 
 def test_idempotency_stable():
@@ -9,3 +11,18 @@ def test_idempotency_changes_on_args():
     k1 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"x":1})
     k2 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"x":2})
     assert k1 != k2
+
+def test_idempotency_changes_on_ids():
+    k1 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"x":1})
+    k2 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s2", action_id="a", args={"x":1})
+    k3 = compute_idempotency_key(tenant_id="t2", run_id="r", step_id="s1", action_id="a", args={"x":1})
+    assert len({k1, k2, k3}) == 3
+
+def test_idempotency_nan_does_not_collide_with_none():
+    k1 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"n":float("nan")})
+    k2 = compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"n":None})
+    assert k1 != k2
+
+def test_idempotency_rejects_non_json_args():
+    with pytest.raises(TypeError):
+        compute_idempotency_key(tenant_id="t", run_id="r", step_id="s1", action_id="a", args={"d":datetime.date(2026,1,1)})
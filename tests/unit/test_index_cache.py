@@ -0,0 +1,32 @@
+import asyncio
+import pytest
+from kernel.adapters.index_cache import CachingIndexProvider
+
+class CountingIndex:
+    def __init__(self):
+        self.builds = 0
+
+    async def load_or_build_trees(self, tenant_id, domains):
+        self.builds += 1
+        return [{"tree":"KB","nodes":[]}]
+
+@pytest.mark.asyncio
+async def test_trees_cached_by_tenant_and_domains():
+    inner = CountingIndex()
+    index = CachingIndexProvider(inner)
+    a = await index.load_or_build_trees("t1", ["support","customers"])
+    b = await index.load_or_build_trees("t1", ["customers","support"])
+    await index.load_or_build_trees("t1", ["support"])
+    assert a is b
+    assert inner.builds == 2
+
+    index.invalidate("t1")
+    await index.load_or_build_trees("t1", ["support","customers"])
+    assert inner.builds == 3
+
+@pytest.mark.asyncio
+async def test_locks_released_after_load():
+    index = CachingIndexProvider(CountingIndex())
+    await asyncio.gather(*(index.load_or_build_trees("t1", ["support"]) for _ in range(3)))
+    await index.load_or_build_trees("t2", ["support"])
+    assert index._locks == {}
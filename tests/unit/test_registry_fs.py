@@ -0,0 +1,29 @@
+import json
+import os
+import pytest
+from kernel.adapters.registry_fs import FSRegistryProvider
+
+def write_registry(path, registry_id):
+    path.write_text(json.dumps({"registry_id": registry_id, "actions": [{"action_id": "a1", "tool": "t"}]}), encoding="utf-8")
+
+@pytest.mark.asyncio
+async def test_fs_registry_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / "registry.json"
+    write_registry(path, "v1")
+    provider = FSRegistryProvider(str(path))
+
+    first = await provider.load_registry("tenant_demo")
+    assert first["registry_id"] == "v1"
+    assert await provider.load_registry("tenant_demo") is first
+    await provider.load_registry("tenant_enterprise_eu")
+    assert len(provider._tenant_cache) == 2
+
+    write_registry(path, "v2")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = await provider.load_registry("tenant_demo")
+    assert second["registry_id"] == "v2"
+    assert second is not first
+    # views built for the old mtime are dropped, including other tenants'
+    assert list(provider._tenant_cache) == [(os.stat(path).st_mtime_ns, "tenant_demo")]
@@ -6,3 +6,9 @@ def test_tenant_override_email_requires_approval():
     reg_demo = apply_tenant_overrides(reg, "tenant_demo")
     a = [x for x in reg_demo["actions"] if x["action_id"] == "act_email_send_v1"][0]
     assert a["security"]["requires_approval"] is True
+
+def test_tenant_override_does_not_mutate_base():
+    reg = json.loads(open("./registry/registry_support_v1.json","r",encoding="utf-8").read())
+    before = json.dumps(reg, sort_keys=True)
+    apply_tenant_overrides(reg, "tenant_demo")
+    assert json.dumps(reg, sort_keys=True) == before
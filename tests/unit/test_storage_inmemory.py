@@ -0,0 +1,19 @@
+import pytest
+from kernel.adapters.storage_inmemory import InMemoryStorage
+
+@pytest.mark.asyncio
+async def test_updates_evict_oldest_at_max_updates():
+    storage = InMemoryStorage(max_updates=3)
+    run = await storage.create_or_load_run(task_id="t", tenant_id="tenant_demo")
+    for i in range(4):
+        await storage.persist_update(run["run_id"], {"n": i})
+    await storage.persist_updates(run["run_id"], [{"n": 4}])
+
+    assert [u["n"] for u in storage.updates[run["run_id"]]] == [2, 3, 4]
+    assert len(storage.persist_calls) == 3
+
+def test_unknown_run_has_no_updates():
+    storage = InMemoryStorage()
+    with pytest.raises(KeyError):
+        storage.updates["run_missing"]
+    assert "run_missing" not in storage.updates
@@ -0,0 +1,14 @@
+import pytest
+from jsonschema import ValidationError
+from kernel.runtime.validation import validate_plan
+
+SCHEMA = "./schemas/plan.schema.json"
+
+def test_validate_plan_ok():
+    plan = {"type":"plan","goal":"x","steps":[{"step_id":"s1","action_id":"a","args":{}}]}
+    validate_plan(plan, SCHEMA)
+    validate_plan(plan, SCHEMA)
+
+def test_validate_plan_rejects_missing_steps():
+    with pytest.raises(ValidationError):
+        validate_plan({"type":"plan","goal":"x"}, SCHEMA)